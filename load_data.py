@@ -51,4 +51,17 @@ def ecg_annotations(record_name):
         return annotation
 
     except Exception as e:
-        print(f"Could not load annotations for record {record_name}. Error: {e}")
\ No newline at end of file
+        print(f"Could not load annotations for record {record_name}. Error: {e}")
+
+def ecg_record(record_name):
+    # load the signal and sampling frequency with a single download
+    # (ecg_signal and record_info each download the record)
+    try:
+        record = wfdb.rdrecord(record_name, pn_dir='mitdb')
+
+        print(f"Successfully loaded signal for record: {record_name}")
+
+        return record.p_signal, record.fs
+
+    except Exception as e:
+        print(f"Could not load record {record_name}. Error: {e}")
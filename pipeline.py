@@ -0,0 +1,138 @@
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+import load_data
+import signal_processing
+import peak_detection
+
+# The pipeline runs several records through the filtering and detection
+# stages. The filtering stages (pywt.wavedec/waverec, np.gradient,
+# np.convolve) release the GIL, but the detector's loop does not. In
+# overlapped mode record N+1 is filtered on a single worker thread while
+# the main thread runs detection on record N. Only one record is filtered
+# ahead, so at most two filtered records are in memory at once.
+#
+# On a 650k sample record at 360 Hz, filtering takes about 0.03 s and
+# detection about 1.16 s, so detection is ~97% of the work and holds the
+# GIL. Overlapping can hide at most the filtering time (~1.03x at best),
+# and in measured runs overlapped mode came out at 0.83x-0.98x of serial
+# with the same peaks. It is kept for comparison, not as a faster mode
+
+# filter_record runs the filtering stages for one ECG signal and returns
+# the integrated signal
+def filter_record(processor, ecg):
+    filtered_ecg = processor.dwavelet_transform(ecg)
+    differentiated_ecg = processor.differentiate(filtered_ecg)
+    squared_ecg = processor.square(differentiated_ecg)
+    return processor.average(squared_ecg)
+
+# make_processor builds the signal processing tools for a record
+def make_processor(fs, level, window_length):
+    window_size = int(window_length * fs)
+    return signal_processing.signal_processing_tools(fs, level, window_size)
+
+# detect_peaks runs the adaptive thresholding algorithm on a filtered record
+def detect_peaks(integrated_ecg, fs):
+    detector = peak_detection.adaptive_threshold_algorithm(fs)
+    return detector.solve(integrated_ecg)
+
+# load_records downloads each record once and returns a dictionary of
+# (signal, fs) for every record that loaded. Records that fail to load
+# are reported by load_data and skipped
+def load_records(record_names):
+    records = {}
+    for record_name in record_names:
+        loaded = load_data.ecg_record(record_name)
+        if loaded is None:
+            print(f"Skipping record {record_name}")
+            continue
+        records[record_name] = loaded
+    return records
+
+# run_records filters and detects the loaded records and returns a dictionary
+# of the detected R-peak indices for each record. With overlapped=False every
+# record is filtered and detected one after the other on the calling thread.
+# With overlapped=True one worker thread filters one record ahead (fixed)
+def run_records(records, level=3, window_length=0.05, overlapped=True):
+    results = {}
+    record_names = list(records)
+
+    if not overlapped:
+        for record_name in record_names:
+            ecg, fs = records[record_name]
+            processor = make_processor(fs, level, window_length)
+            results[record_name] = detect_peaks(filter_record(processor, ecg), fs)
+        return results
+
+    def submit(pool, record_name):
+        ecg, fs = records[record_name]
+        return pool.submit(filter_record, make_processor(fs, level, window_length), ecg)
+
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        future = submit(pool, record_names[0]) if record_names else None
+
+        for i, record_name in enumerate(record_names):
+            # Start filtering the next record before detecting this one
+            next_future = None
+            if i + 1 < len(record_names):
+                next_future = submit(pool, record_names[i + 1])
+
+            integrated_ecg = future.result()
+            results[record_name] = detect_peaks(integrated_ecg, records[record_name][1])
+
+            # Drop this record's filtered signal before moving on
+            integrated_ecg = None
+            future = next_future
+
+    return results
+
+# time_run returns how long one run_records call takes and its results
+def time_run(records, overlapped):
+    start = time.perf_counter()
+    results = run_records(records, overlapped=overlapped)
+    return time.perf_counter() - start, results
+
+# Compares the serial and overlapped throughput over a few records
+def main():
+    record_names = ['100', '101', '200', '203', '207']
+    repeats = 3
+
+    # Load everything first so the timings only cover filtering and detection
+    records = load_records(record_names)
+    if len(records) == 0:
+        print("No records loaded")
+        return 1
+
+    # Warm-up pass so neither mode pays for first-call overhead
+    run_records(records, overlapped=False)
+
+    # Alternate the order of the two modes and keep the median of each
+    serial_times = []
+    overlapped_times = []
+    for i in range(repeats):
+        for overlapped in ([False, True] if i % 2 == 0 else [True, False]):
+            run_time, results = time_run(records, overlapped)
+            if overlapped:
+                overlapped_times.append(run_time)
+                overlapped_results = results
+            else:
+                serial_times.append(run_time)
+                serial_results = results
+
+    serial_time = np.median(serial_times)
+    overlapped_time = np.median(overlapped_times)
+
+    print("\n--- Pipeline Results ---")
+    for record_name in records:
+        same = np.array_equal(serial_results[record_name], overlapped_results[record_name])
+        print(f"Record {record_name}: {len(overlapped_results[record_name])} peaks (matches serial: {same})")
+
+    print(f"Serial time (median of {repeats}): {serial_time:.2f} s")
+    print(f"Overlapped time (median of {repeats}): {overlapped_time:.2f} s")
+    print(f"Speedup: {serial_time / overlapped_time:.2f}x")
+
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
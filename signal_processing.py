@@ -22,9 +22,10 @@ class signal_processing_tools:
         coeffs = pywt.wavedec(signal[:,0], wavelet, self.level)
 
         # zero the scales we want to filter (cD2, cD1)
+        # (in place, the coefficient arrays are fresh from wavedec)
         #coeffs[0] = np.zeros_like(coeffs[0])
         for i in range(1, self.level - 1):
-            coeffs[i] = np.zeros_like(coeffs[i])
+            coeffs[i].fill(0)
 
         # reconstruct the signal using the inverse wavelet transform
         return pywt.waverec(coeffs, wavelet)